@@ -1,173 +1,220 @@
+import functools
+import hashlib
 import json
 import os
 import re
-import requests  # For making HTTP requests
-from urllib.parse import urlencode
-
-
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+try:
+    import orjson as _json_fast  # Optional C parser, much faster on large collections and bodies
+except ImportError:
+    import json as _json_fast
+
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+_PLACEHOLDER_RE = re.compile(r'\{\{(.*?)\}\}')
+_BOOL_STRINGS = frozenset(("true", "false"))
+_INT_RE = re.compile(r'\A-?[0-9]+\Z')
+_FLOAT_RE = re.compile(r'\A-?(?:[0-9]+\.[0-9]*|\.[0-9]+)\Z')
+_PATH_PARAM_RE = re.compile(r'(?P<hex>[a-f0-9]{24,})\Z|(?P<num>\d+)\Z')
+
+# Turns underscores into spaces so str.split() separates camel-case words in a single C pass
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+# Dart field declarations for JSON value types (strings are classified by content)
+_DART_TYPES = {
+    bool: "final bool?",
+    int: "final int?",
+    float: "final double?",
+    list: "final List<dynamic>?",  # Handle arrays as nullable dynamic lists
+}
+
+# Collections smaller than this are generated in-process; a worker pool costs more than it saves
+_PARALLEL_MIN_REQUESTS = 256
+
+# Per-folder request digests and written files from the previous run, stored in the output directory.
+# Bump the version whenever the generated code changes so stale output is regenerated.
+_CACHE_FILENAME = '.cache.json'
+_CACHE_VERSION = 3
+
+# Name-independent generation results, keyed by request digest (see _request_shape).
+# Oldest-used entries are evicted once the cache holds this many shapes.
+_REQUEST_SHAPE_CACHE_SIZE = 1024
+_request_shapes = {}
+
+# Directories already created during the current run (see _ensure_dir)
+_ensured_dirs = set()
+
+
+@functools.lru_cache(maxsize=4096)
 def snake_case(name):
     """Convert a string to snake_case."""
-    name = re.sub(r'[\W_]+', ' ', name)  # Replace non-alphanumeric characters with space
+    name = _NON_ALNUM_RE.sub(' ', name)  # Replace non-alphanumeric characters with space
     return '_'.join(name.lower().split())
 
+@functools.lru_cache(maxsize=4096)
 def upper_camel_case(name):
     """Convert a string to UpperCamelCase."""
-    return ''.join(word.title() for word in name.split()).replace('_', '')
+    return ''.join(word.title() for word in name.translate(_UNDERSCORE_TO_SPACE).split())
+
+@functools.lru_cache(maxsize=4096)
 def lower_camel_case(name):
     """Convert a string to lowerCamelCase."""
     if not name:  # Check if the name is empty
         return name  # Return the input name if it's empty
 
-    # Convert the name into camel case (first letter of each word capitalized, except the first word)
-    name = ''.join(word.title() for word in name.split())
+    # Split on whitespace and underscores so no separator survives into the joined name
+    name = ''.join(word.title() for word in name.translate(_UNDERSCORE_TO_SPACE).split())
 
-    # Make the first character lowercase, and remove underscores
-    return (name[0].lower() + name[1:]).replace('_', '')
+    # Make the first character lowercase
+    return name[:1].lower() + name[1:]
 
 
 def extract_variables(text):
     """Extract variables from the {{...}} placeholders in a string."""
-    return re.findall(r'\{\{(.*?)\}\}', text)
+    return _PLACEHOLDER_RE.findall(text)
 
 def contains_placeholder(text):
     """Check if the string contains the pattern '{{...}}'."""
-    pattern = r'\{\{(.*?)\}\}'
-    return bool(re.search(pattern, text))
+    return bool(_PLACEHOLDER_RE.search(text))
 
 def replace_url_variables(url):
     """Replace {{...}} placeholders in the URL with Dart variable syntax."""
-    return re.sub(r'\{\{(.*?)\}\}', lambda match: f"${match.group(1)}/", url)
+    return _PLACEHOLDER_RE.sub(lambda match: f"${match.group(1)}/", url)
 
-def replace_header_variables(value):
+def replace_header_variables(value, var_map=None):
     """Replace {{...}} placeholders in header values with Dart variable syntax (no '/')."""
-    return re.sub(r'\{\{(.*?)\}\}', lambda match: f"${lower_camel_case(match.group(1))}", value)
+    if var_map is None:  # No precomputed {placeholder: lowerCamelCase} map from the caller
+        return _PLACEHOLDER_RE.sub(lambda match: f"${lower_camel_case(match.group(1))}", value)
+    return _PLACEHOLDER_RE.sub(lambda match: f"${var_map[match.group(1)]}", value)
 
 def handle_path_parameters(url, path):
     """Detect dynamic path parameters in the URL and replace them with Dart variables."""
     path_variables = []
-    updated_url = url
+    url_segments = url.split('/')
+    # Postman's path lists the trailing segments of the URL, so normally each one sits at a known index
+    offset = len(url_segments) - len(path)
+    aligned = offset >= 0 and url_segments[offset:] == path
+    cursor = 0  # Otherwise search forward, never looking behind the last match
     for i, segment in enumerate(path):
-        if re.match(r'^[a-f0-9]{24,}$', segment):  # UUID-like pattern
-            param_name = 'id' if i == len(path) - 1 else f"param{i}"
-            updated_url = updated_url.replace(segment, f"${param_name}")
-            path_variables.append(lower_camel_case(param_name))
-        elif re.match(r'^\d+$', segment):  # Numeric path segment
+        if _PATH_PARAM_RE.match(segment):  # UUID-like or numeric path segment
+            if aligned:
+                position = offset + i
+            else:
+                try:
+                    position = url_segments.index(segment, cursor)
+                except ValueError:
+                    continue
+                cursor = position + 1
             param_name = 'id' if i == len(path) - 1 else f"param{i}"
-            updated_url = updated_url.replace(segment, f"${param_name}")
+            url_segments[position] = f"${param_name}"
             path_variables.append(lower_camel_case(param_name))
-    return updated_url, path_variables
-
-def generate_query_class(query_params, class_name):
-    """Generate a Dart class for query parameters."""
-    if not query_params:
-        return ''
+    return '/'.join(url_segments), path_variables
+
+def _classify_str(value):
+    """Return the Dart field declaration for a string value."""
+    if value in _BOOL_STRINGS:
+        return "final bool?"
+    elif _INT_RE.match(value):
+        return "final int?"
+    elif _FLOAT_RE.match(value):
+        return "final double?"
+    return "final String?"
+
+def _infer_type(value):
+    """Return the Dart field declaration for a JSON value."""
+    value_type = type(value)
+    if value_type is str:
+        return _classify_str(value)
+    return _DART_TYPES.get(value_type, "dynamic")  # Default type
+
+@functools.lru_cache(maxsize=1024)
+def _render_class(class_name, fields, method_name):
+    """Render a Dart class from (key, dart_type) fields with a const constructor and a map method."""
+    parts = [f"class {class_name} {{\n"]
+    parts.extend(f"  {dart_type} {key};\n" for key, dart_type in fields)
 
-    # Parse the JSON query parameters into a dictionary
+    # Generate constructor
+    constructor_args = ', '.join(f"this.{key}" for key, _ in fields) + ","
+    parts.append(f"\n  const {class_name}({{{constructor_args}}});\n\n")
+
+    # Generate the map-building method (`toMap` for query parameters, `toJson` for bodies)
+    parts.append(f"  Map<String, dynamic> {method_name}() {{\n")
+    parts.append("    return {\n")
+    parts.extend(f"      if ({key} != null) '{key}': {key},\n" for key, _ in fields)
+    parts.append("    };\n  }\n")
+
+    parts.append("}\n")
+    return "".join(parts)
+
+def _query_fields(query_params):
+    """Return the (key, dart_type) fields for a dictionary of query parameters."""
+    # Generate fields based on the query structure, skipping parameters with an empty key
+    return tuple((key, _infer_type(value)) for key, value in query_params.items() if key)
+
+def _load_body(body_raw):
+    """Parse a raw JSON body, matching what the stdlib json module would return."""
+    if _json_fast is json:
+        return json.loads(body_raw)
+    try:
+        body_content = _json_fast.loads(body_raw)
+    except json.JSONDecodeError:
+        return json.loads(body_raw)  # orjson rejects NaN/Infinity, which json accepts
+    # orjson reads integers wider than 64 bits as floats. Only an integral float at least that large
+    # can be one of those, so ordinary decimals keep the single orjson parse.
+    if isinstance(body_content, dict) and any(
+            type(value) is float and value.is_integer() and abs(value) >= 2**63
+            for value in body_content.values()):
+        return json.loads(body_raw)
+    return body_content
+
+def _body_fields(body_raw):
+    """Return the (key, dart_type) fields for a raw JSON body, or None if it is not valid JSON."""
+    # Parse the JSON body into a dictionary
     try:
-        query_content = query_params
+        body_content = body_raw if isinstance(body_raw, dict) else _load_body(body_raw)
     except json.JSONDecodeError as e:
-        print(f"Invalid JSON query parameters: {e}")
-        return ''
-
-    class_code = f"class {class_name} {{\n"
-    empty_lists = [key for key, value in query_content.items() if key =='']
-    if empty_lists:
-        for key in empty_lists:
-            query_content.pop(key)
-    # Generate fields based on the query structure
-    for key, value in query_content.items():
-        dart_type = "dynamic"  # Default type
-        if isinstance(value, list):
-            dart_type = "final List<dynamic>?"  # Handle arrays as nullable dynamic lists
-        elif isinstance(value, bool):
-            dart_type = "final bool?"
-        elif isinstance(value, int):
-            dart_type = "final int?"
-        elif isinstance(value, float):
-            dart_type = "final double?"
-        elif isinstance(value, str):
-            if value == "true" or value == "false":
-                dart_type = "final bool?"
-            elif value.isdigit():
-                    dart_type = "final int?"
-            elif value.replace('.', '').isdigit():
-                    dart_type = "final double?"
-            else:
-                dart_type = "final String?"
-
-        class_code += f"  {dart_type} {key};\n"
-
-    # Generate constructor
-    constructor_args = ', '.join(f"this.{key}" for key in query_content) + ","
-    class_code += f"\n  const {class_name}({{{constructor_args}}});\n\n"
-
-    # Generate `toMap` method for query parameters
-    class_code += "  Map<String, dynamic> toMap() {\n"
-    class_code += "    return {\n"
-    for key in query_content:
-        class_code += f"      if ({key} != null) '{key}': {key},\n"
-    class_code += "    };\n  }\n"
-
-    class_code += "}\n"
-    return class_code
+        print(f"Invalid JSON body: {e}")
+        return None
 
+    # Generate fields based on the JSON structure
+    return tuple((key, _infer_type(value)) for key, value in body_content.items() if key != '')
 
+def generate_query_class(query_params, class_name):
+    """Generate a Dart class for query parameters."""
+    if not query_params:
+        return ''
+    return _render_class(class_name, _query_fields(query_params), 'toMap')
 
 def generate_body_class(body_raw, class_name):
     """Generate a Dart class for body parameters."""
     if not body_raw:
         return ''
-
-    # Parse the JSON body into a dictionary
-    try:
-        body_content = json.loads(body_raw)
-    except json.JSONDecodeError as e:
-        print(f"Invalid JSON body: {e}")
+    fields = _body_fields(body_raw)
+    if fields is None:
         return ''
-
-    class_code = f"class {class_name} {{\n"
-
-    # Generate fields based on the JSON structure
-    for key, value in body_content.items():
-        if key == '':
-            continue
-        dart_type = "dynamic"  # Default type
-        if isinstance(value, list):
-            dart_type = "final List<dynamic>?"  # Handle arrays as nullable dynamic lists
-        elif isinstance(value, bool):
-            dart_type = "final bool?"
-        elif isinstance(value, int):
-            dart_type = "final int?"
-        elif isinstance(value, float):
-            dart_type = "final double?"
-        elif isinstance(value, str):
-            if value == "true" or value == "false":
-                dart_type = "final bool?"
-            elif value.isdigit():
-                    dart_type = "final int?"
-            elif value.replace('.', '').isdigit():
-                    dart_type = "final double?"
-            else:
-                dart_type = "final String?"
-
-        class_code += f"  {dart_type} {key};\n"
-
-    # Generate constructor
-    constructor_args = ', '.join(f"this.{key}" for key in body_content) + ","
-    class_code += f"\n  const {class_name}({{{constructor_args}}});\n\n"
-
-    # Generate `toJson` method
-    class_code += "  Map<String, dynamic> toJson() {\n"
-    class_code += "    return {\n"
-    for key in body_content:
-        class_code += f"      if ({key} != null) '{key}': {key},\n"
-    class_code += "    };\n  }\n"
-
-    class_code += "}\n"
-    return class_code
-
-def generate_dio_function(request_name, request):
-    """Generate a Dart function for a given Postman request."""
+    return _render_class(class_name, fields, 'toJson')
+
+def _request_key(request):
+    """Return a short digest of the request's canonical JSON form."""
+    canonical = json.dumps(request, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+def _request_shape(request, request_key=None):
+    """Return the parts of a request's generated code that do not depend on its name."""
+    # Collections often repeat the same request under different names, so cache by request digest
+    if request_key is None:
+        request_key = _request_key(request)
+    shape = _request_shapes.pop(request_key, None)
+    if shape is None:
+        shape = _build_request_shape(request)
+        if len(_request_shapes) >= _REQUEST_SHAPE_CACHE_SIZE:
+            del _request_shapes[next(iter(_request_shapes))]  # Evict the least recently used shape
+    _request_shapes[request_key] = shape  # (Re)insert as the most recently used entry
+    return shape
+
+def _build_request_shape(request):
+    """Compute the URL, name-independent parameters, headers and class fields of a request."""
     method = request['method'].lower()
     url = request['url']['raw']
     headers = request.get('header', [])
@@ -175,16 +222,21 @@ def generate_dio_function(request_name, request):
     auth = request.get('auth', None)
 
     # Remove query parameters from the URL
-    url_without_query = re.split(r'\?', url)[0]
+    url_without_query = url.partition('?')[0]
 
-    # Extract the base URL including optional port
-    base_url_match = re.match(r'^(https?://[a-zA-Z0-9.-]+(:[0-9]+)?)(/.*)?$', url_without_query)
-    if base_url_match:
-        base_url = base_url_match.group(1)  # Base URL (e.g., http://localhost:8080)
-        endpoint = base_url_match.group(3) or ''  # Endpoint is the part after the base URL
-    else:
-        base_url = None
-        endpoint = url_without_query  # If no match, treat the entire URL as the endpoint
+    # Extract the base URL including optional port (a templated host like {{host}} stays in the endpoint)
+    base_url = None
+    endpoint = url_without_query  # If no match, treat the entire URL as the endpoint
+    try:
+        url_parts = urlsplit(url_without_query)
+    except ValueError:  # e.g. an unbalanced IPv6 bracket; keep the whole URL as the endpoint
+        url_parts = None
+    if (url_parts is not None and url_parts.scheme in ('http', 'https') and url_parts.netloc
+            and '{{' not in url_parts.netloc):
+        prefix = f"{url_parts.scheme}://{url_parts.netloc}"
+        if url_without_query.startswith(prefix):
+            base_url = prefix  # Base URL (e.g., http://localhost:8080)
+            endpoint = url_without_query[len(base_url):]  # Endpoint is the part after the base URL
 
     # Replace hardcoded base URL with `$baseUrl`
     dart_url = f"$baseUrl{endpoint}" if base_url else url_without_query
@@ -195,155 +247,224 @@ def generate_dio_function(request_name, request):
 
     # Extract query parameters from the original URL
     query_params = {param['key']: param['value'] for param in request['url'].get('query', [])}
+    query_fields = _query_fields(query_params) if query_params else None
 
-    # Generate Dart class for query parameters
-    query_params_class_code = ''
-    if query_params:
-        query_params_class_code = generate_query_class(query_params, upper_camel_case(request_name + '_query_params'))
-
-    # Generate Dart class for body if present
-    body_class_code = ''
+    # Parse the body if present
+    body_fields = None
     if body:
         body_raw = body.get('raw', '')  # Raw body data
         if body_raw:
-            body_class_code = generate_body_class(body_raw, upper_camel_case(request_name + '_body'))
+            body_fields = _body_fields(body_raw)
 
     # Extract all variables for the function signature
-    url_variables = extract_variables(dart_url)
-    header_variables = [
-        extract_variables(header['value']) for header in headers if '{{' in header['value']]
-    header_variables = [var for sublist in header_variables for var in sublist]  # Flatten list
-    all_variables = set(url_variables + header_variables + path_parameters)
+    # One scan over the URL and every header value; '.' never matches the newline separator,
+    # so a placeholder cannot span two fields
+    scan_text = '\n'.join([dart_url, *(header['value'] for header in headers)])
+    all_variables = set(_PLACEHOLDER_RE.findall(scan_text))
+    all_variables.update(path_parameters)
 
-    # Convert all variables to lowerCamelCase for Dart function parameters
-    dart_parameters = ', '.join([f"required String {lower_camel_case(var)}" for var in all_variables])
+    # Convert all variables to lowerCamelCase once, for both the parameters and the header values
+    var_map = {var: lower_camel_case(var) for var in all_variables}
+    dart_parameters = ', '.join([f"required String {name}" for name in var_map.values()])
 
     # Add `baseUrl` as a required parameter
     if base_url:
         dart_parameters += ', required String baseUrl'
 
+    # Add headers dynamically
+    headers_code = ''
+    if headers:
+        parts = ["    dio.options.headers = {\n"]
+        for header in headers:
+            header_value = header['value']
+            if '{{' in header_value:
+                key = header['key']
+                parts.append(f"      '{key}': {replace_header_variables(header_value, var_map)},\n")
+            else:
+                parts.append(f"      '{header['key']}': '{header_value}',\n")
+        parts.append("    };\n")
+        headers_code = "".join(parts)
+
+    bearer_auth = bool(auth and auth.get('type') == 'bearer')
+    return method, dart_url, dart_parameters, headers_code, bearer_auth, query_fields, body_fields
+
+def generate_dio_function(request_name, request, request_key=None):
+    """Generate a Dart function for a given Postman request."""
+    shape = _request_shape(request, request_key)
+    method, dart_url, dart_parameters, headers_code, bearer_auth, query_fields, body_fields = shape
+
+    # Names derived from the request name, reused throughout the generated code
+    snake_name = snake_case(request_name)
+    lower_name = lower_camel_case(snake_name)
+    query_class_name = upper_camel_case(request_name + '_query_params')
+    body_class_name = upper_camel_case(request_name + '_body')
+
+    # Generate Dart class for query parameters
+    query_params_class_code = ''
+    if query_fields is not None:
+        query_params_class_code = _render_class(query_class_name, query_fields, 'toMap')
+
+    # Generate Dart class for body if present
+    body_class_code = ''
+    if body_fields is not None:
+        body_class_code = _render_class(body_class_name, body_fields, 'toJson')
+
     # Add query parameters
-    if query_params:
-        dart_parameters += f', required {upper_camel_case(request_name + "_query_params")} {lower_camel_case(snake_case(request_name))}QueryParams'
+    if query_params_class_code:
+        dart_parameters += f', required {query_class_name} {lower_name}QueryParams'
 
     # Add body parameters
     if body_class_code:
-        dart_parameters += f', required {upper_camel_case(request_name + "_body")} {lower_camel_case(snake_case(request_name))}Body'
+        dart_parameters += f', required {body_class_name} {lower_name}Body'
 
     # Add accessToken if present
-    if auth and auth.get('type') == 'bearer':
+    if bearer_auth:
         dart_parameters += ', required String accessToken'
 
     # Generate the function
     function_name = lower_camel_case(request_name)
-    dart_code = f"import 'package:dio/dio.dart';\n\n"
-    if query_params:
-        dart_code += f"import '{snake_case(request_name)}_query_params.dart';\n"
+    parts = ["import 'package:dio/dio.dart';\n\n"]
+    if query_params_class_code:
+        parts.append(f"import '{snake_name}_query_params.dart';\n")
     if body_class_code:
-        dart_code += f"import '{snake_case(request_name)}_body.dart';\n\n"
-    dart_code += f"class {upper_camel_case(request_name)} {{\n"
-    dart_code += f"  static Future<Response> {function_name}({{{dart_parameters}}}) async {{\n"
-    dart_code += "    Dio dio = Dio();\n"
-
-    # Add headers dynamically
-    if headers:
-        dart_code += "    dio.options.headers = {\n"
-        for header in headers:
-            header_value = header['value']
-            if '{{' in header_value:
-                key = header['key']
-                dart_code += f"      '{key}': {replace_header_variables(header_value)},\n"
-            else:
-                dart_code += f"      '{header['key']}': '{header_value}',\n"
-        dart_code += "    };\n"
+        parts.append(f"import '{snake_name}_body.dart';\n\n")
+    parts.append(f"class {upper_camel_case(request_name)} {{\n")
+    parts.append(f"  static Future<Response> {function_name}({{{dart_parameters}}}) async {{\n")
+    parts.append("    Dio dio = Dio();\n")
+    parts.append(headers_code)
 
     # Add authorization if present
-    if auth and auth.get('type') == 'bearer':
-        dart_code += f"    dio.options.headers['Authorization'] = 'Bearer $accessToken';\n"
+    if bearer_auth:
+        parts.append(f"    dio.options.headers['Authorization'] = 'Bearer $accessToken';\n")
 
     # Prepare the request call
-    dart_code += f"    Response response = await dio.{method}(\n"
-    dart_code += f"      '{dart_url}',\n"
-    if query_params:
-        dart_code += f"      queryParameters: {lower_camel_case(snake_case(request_name))}QueryParams.toMap(),\n"
+    parts.append(f"    Response response = await dio.{method}(\n")
+    parts.append(f"      '{dart_url}',\n")
+    if query_params_class_code:
+        parts.append(f"      queryParameters: {lower_name}QueryParams.toMap(),\n")
     if body_class_code:
-        dart_code += f"      data: {lower_camel_case(snake_case(request_name))}Body.toJson(),\n"
-    dart_code += "    );\n\n"
-    dart_code += "    print(response.data);\n\n"
-    dart_code += "    return response;\n"
-    dart_code += "  }\n}\n"
+        parts.append(f"      data: {lower_name}Body.toJson(),\n")
+    parts.append("    );\n\n")
+    parts.append("    print(response.data);\n\n")
+    parts.append("    return response;\n")
+    parts.append("  }\n}\n")
+
+    dart_code = "".join(parts)
 
     # Generate filename and folder
-    folder_name = snake_case(request_name)
+    folder_name = snake_name
     filename = f"{folder_name}.dart"
     return dart_code, folder_name, filename, query_params_class_code, body_class_code
-def process_postman_collection(collection, output_dir):
-    """Process the Postman collection and generate Dart files for each request."""
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
 
-    for item in collection['item']:
+def _walk(items):
+    """Yield (request_name, request) for every request in a (possibly nested) item list."""
+    for item in items:
         if 'item' in item:
-            for subitem in item['item']:
-                if 'item' in subitem:
-                    for subsubitem in subitem['item']:
-                        request_name = subsubitem['name'].replace('  ', ' ')  # Replace extra spaces
-                        request = subsubitem['request']
-                        dart_code, folder_name, filename, query_params_class_code, body_class_code = generate_dio_function(request_name, request)
-                        request_folder = os.path.join(output_dir, folder_name)
-                        if not os.path.exists(request_folder):
-                            os.makedirs(request_folder)
-                        with open(os.path.join(request_folder, filename), 'w') as f:
-                            f.write(dart_code)
-                        # Write queryParams class to file if present
-                        if query_params_class_code:
-                            with open(os.path.join(request_folder, f'{folder_name}_query_params.dart'), 'w') as f:
-                                f.write(query_params_class_code)
-                        # Write body class to file if present
-                        if body_class_code:
-                            with open(os.path.join(request_folder, f'{folder_name}_body.dart'), 'w') as f:
-                                f.write(body_class_code)
-                else:
-                    request_name = subitem['name']
-                    request = subitem['request']
-                    dart_code, folder_name, filename, query_params_class_code, body_class_code = generate_dio_function(request_name, request)
-                    request_folder = os.path.join(output_dir, folder_name)
-                    if not os.path.exists(request_folder):
-                        os.makedirs(request_folder)
-                    with open(os.path.join(request_folder, filename), 'w') as f:
-                        f.write(dart_code)
-                    # Write queryParams class to file if present
-                    if query_params_class_code:
-                        with open(os.path.join(request_folder, f'{folder_name}_query_params.dart'), 'w') as f:
-                            f.write(query_params_class_code)
-                    # Write body class to file if present
-                    if body_class_code:
-                        with open(os.path.join(request_folder, f'{folder_name}_body.dart'), 'w') as f:
-                            f.write(body_class_code)
+            yield from _walk(item['item'])
         else:
-            request_name = item['name']
-            request = item['request']
-            dart_code, folder_name, filename, query_params_class_code, body_class_code = generate_dio_function(request_name, request)
-            request_folder = os.path.join(output_dir, folder_name)
-            if not os.path.exists(request_folder):
-                os.makedirs(request_folder)
-            with open(os.path.join(request_folder, filename), 'w') as f:
-                f.write(dart_code)
-            # Write queryParams class to file if present
-            if query_params_class_code:
-                with open(os.path.join(request_folder, f'{folder_name}_query_params.dart'), 'w') as f:
-                    f.write(query_params_class_code)
-            # Write body class to file if present
-            if body_class_code:
-                with open(os.path.join(request_folder, f'{folder_name}_body.dart'), 'w') as f:
-                    f.write(body_class_code)
-
-# Load Postman collection from file
-with open('postman_collection.json', 'r') as f:
-    collection = json.load(f)
-
-# Output directory for Dart files
-output_directory = "generated_dart_requests"
-
-# Generate Dart files
-process_postman_collection(collection, output_directory)
+            yield item['name'].replace('  ', ' '), item['request']  # Replace extra spaces
+
+def _generate_one(leaf):
+    """Generate the Dart sources for one (request_name, request, request_key) leaf; runs in a worker process."""
+    request_name, request, request_key = leaf
+    return generate_dio_function(request_name, request, request_key)
+
+def _folder_digests(leaves):
+    """Hash the requests written into each output folder, in collection order."""
+    digests = {}
+    for request_name, _, request_key in leaves:
+        digest = digests.setdefault(snake_case(request_name), hashlib.blake2b(digest_size=16))
+        digest.update(request_name.encode('utf-8') + b'\0' + request_key)
+    return {folder_name: digest.hexdigest() for folder_name, digest in digests.items()}
+
+def _load_generation_cache(output_dir):
+    """Return the folder entries recorded by the previous run, or {} if there are none."""
+    try:
+        with open(os.path.join(output_dir, _CACHE_FILENAME), 'rb') as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != _CACHE_VERSION:
+        return {}
+    return cache.get('folders', {})
+
+def _folder_is_current(entry, digest, folder_path):
+    """Return True if a cached folder entry matches digest and every file it lists still exists."""
+    if not isinstance(entry, dict) or entry.get('digest') != digest or not entry.get('files'):
+        return False
+    return all(os.path.exists(os.path.join(folder_path, filename)) for filename in entry['files'])
+
+def process_postman_collection(collection, output_dir):
+    """Process the Postman collection and generate Dart files for each request."""
+    _ensured_dirs.clear()  # Output from an earlier run may have been deleted since
+    _ensure_dir(output_dir)
+
+    # Skip folders whose requests are unchanged since the last run and whose output still exists
+    leaves = [
+        (request_name, request, _request_key(request)) for request_name, request in _walk(collection['item'])]
+    digests = _folder_digests(leaves)
+    previous = _load_generation_cache(output_dir)
+    unchanged = {
+        folder_name for folder_name, digest in digests.items()
+        if _folder_is_current(previous.get(folder_name), digest, os.path.join(output_dir, folder_name))}
+    leaves = [leaf for leaf in leaves if snake_case(leaf[0]) not in unchanged]
+
+    if len(leaves) < _PARALLEL_MIN_REQUESTS or (os.cpu_count() or 1) < 2:
+        written = _write_results(map(_generate_one, leaves), output_dir)
+    else:
+        # Code generation is pure Python CPU work, so spread it over processes; files are written here
+        with ProcessPoolExecutor() as executor:
+            written = _write_results(executor.map(_generate_one, leaves, chunksize=16), output_dir)
+
+    # Every folder was either regenerated just now or skipped as unchanged
+    folders = {
+        folder_name: {
+            'digest': digest,
+            'files': sorted(written[folder_name]) if folder_name in written else previous[folder_name]['files'],
+        }
+        for folder_name, digest in digests.items()}
+    cache = {'version': _CACHE_VERSION, 'folders': folders}
+    _write_file(os.path.join(output_dir, _CACHE_FILENAME), json.dumps(cache, indent=2, sort_keys=True))
+
+def _ensure_dir(path):
+    """Create a directory (and its parents) unless this run already has."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _write_file(path, text):
+    """Write text to path as UTF-8, skipping the text-mode I/O layer."""
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+def _write_results(results, output_dir):
+    """Write the generated Dart files for each result and return the file names written per folder."""
+    written = {}
+    for dart_code, folder_name, filename, query_params_class_code, body_class_code in results:
+        request_folder = os.path.join(output_dir, folder_name)
+        _ensure_dir(request_folder)
+        folder_files = written.setdefault(folder_name, set())
+        _write_file(os.path.join(request_folder, filename), dart_code)
+        folder_files.add(filename)
+        # Write queryParams class to file if present
+        if query_params_class_code:
+            query_params_filename = f'{folder_name}_query_params.dart'
+            _write_file(os.path.join(request_folder, query_params_filename), query_params_class_code)
+            folder_files.add(query_params_filename)
+        # Write body class to file if present
+        if body_class_code:
+            body_filename = f'{folder_name}_body.dart'
+            _write_file(os.path.join(request_folder, body_filename), body_class_code)
+            folder_files.add(body_filename)
+    return written
+
+if __name__ == '__main__':
+    # Load Postman collection from file
+    with open('postman_collection.json', 'rb') as f:
+        collection = _json_fast.loads(f.read())
+
+    # Output directory for Dart files
+    output_directory = "generated_dart_requests"
+
+    # Generate Dart files
+    process_postman_collection(collection, output_directory)